@@ -9,7 +9,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from .config import GOOGLE_HOME, AI_READY_TIMEOUT_SEC, SEARCH_PAGE_OPEN_TIMEOUT_SEC, NEW_SEARCH_BUTTON_WAIT_SEC
-from .selectors import AI_TEXTAREA_SEL, AI_TEXTAREA_ALT, NEW_SEARCH_BUTTON_SELECTORS
+from .selectors import AI_TEXTAREA_SEL, AI_TEXTAREA_ALT, NEW_SEARCH_BUTTON_SELECTORS, CAPTCHA_SELECTOR_GROUP
 
 
 def is_profile_blocked(driver: webdriver.Chrome) -> bool:
@@ -36,18 +36,17 @@ def is_profile_blocked(driver: webdriver.Chrome) -> bool:
             print("[BLOCK_DETECT] Google 'unusual traffic' page detected")
             return True
         
-        # Check for reCAPTCHA/HCaptcha elements
-        captcha_selectors = [
-            "iframe[src*='recaptcha']",
-            "iframe[src*='hcaptcha']",
-            "div.g-recaptcha",
-            "div.h-captcha",
-            "#captcha-form",
-        ]
-        for sel in captcha_selectors:
-            if driver.find_elements(By.CSS_SELECTOR, sel):
-                print(f"[BLOCK_DETECT] Captcha detected: {sel}")
-                return True
+        # Check for reCAPTCHA/HCaptcha elements (all selectors in one lookup)
+        captcha_elements = driver.find_elements(By.CSS_SELECTOR, CAPTCHA_SELECTOR_GROUP)
+        if captcha_elements:
+            # Describe the matched element (the grouped lookup doesn't say which selector hit)
+            try:
+                el = captcha_elements[0]
+                desc = f"<{el.tag_name} id='{el.get_attribute('id') or ''}' class='{el.get_attribute('class') or ''}'>"
+            except Exception:
+                desc = "<unknown>"
+            print(f"[BLOCK_DETECT] Captcha detected: {desc}")
+            return True
         
         # Check body text for block indicators
         try:
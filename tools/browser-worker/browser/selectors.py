@@ -2,10 +2,84 @@
 """DOM selectors and content extraction"""
 import re
 import json
-from typing import Dict
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 
+logger = logging.getLogger(__name__)
 
+# Single-pass cleanup of Google AI artifacts in raw text, alternatives are tried left to right:
+# 1. Markdown artifacts, which appear when AI returns fragmented JSON
+#    e.g., {"domain":"Use code with caution.jsonabm.comUse code with caution.json"}
+# 2. Code fences (```json / ```)
+# 3. Standalone "json" word before JSON content (but not inside strings).
+#    Alternatives 2 and 3 look past artifacts removed in the same pass, matching
+#    what separate sequential passes would do once those artifacts are gone
+#    e.g., [jsonUse code with caution."x"] -> ["x"]
+_CLEAN_RE = re.compile(
+    r'(?i:use code with caution\.?)'
+    r'|(?i:```(?:use code with caution\.?)*json\s*)'
+    r'|```\s*'
+    r'|(?i:\bjson(?=(?:\s*(?:use code with caution\.?|```(?:json)?))*\s*[{"\[]))'
+)
+
+# Valid JSON characters: letters, digits, JSON syntax, whitespace
+# Everything else (markdown, control characters, non-ASCII garbage) is removed
+# Allow: a-z A-Z 0-9 {} [] : , " ' . - _ @ space tab
+_ALLOWED_JSON_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789{}[]:,\"'.@-_ \t"
+)
+_DISALLOWED_ASCII = bytes(b for b in range(128) if chr(b) not in _ALLOWED_JSON_CHARS)
+
+# Artifacts inside parsed JSON string values
+# The phrase is removed again per value: _CLEAN_RE runs before fence removal and
+# the character filter, which can rejoin a split phrase (e.g. "Use\u200b code ...")
+_USE_CODE_RE = re.compile(r'use code with caution\.?', re.IGNORECASE)
+# Domain-like value wrapped in "json" artifacts, e.g. "jsonabm.comjson" or "jsonjsonabm.com"
+# (stacked "Use code with caution.json" fragments can leave two on one side)
+# At least two characters before the TLD dot; quantifiers are bounded (DNS limits)
+# so adversarial values can't trigger heavy backtracking;
+# the TLD is lazy so trailing "json" goes to the suffix, not the TLD
+_JSON_WRAPPED_DOMAIN_RE = re.compile(
+    r'(?P<prefix>(?:json){0,2})'
+    r'(?P<core>[a-z0-9][a-z0-9.-]{0,252}[a-z0-9]\.[a-z]{2,63}?)'
+    r'(?P<suffix>(?:json){0,2})',
+    re.IGNORECASE,
+)
+# Maximum number of "json" artifacts stripped from one value (both sides together)
+_MAX_JSON_ARTIFACTS = 2
+
+# Placeholder domains that mark a templated (not real) AI answer
+_PLACEHOLDER_RE = re.compile(r'example|domain\.com', re.IGNORECASE)
+
+
+def _parse_valid_json(json_str: str) -> Tuple[bool, Any]:
+    """Validate JSON string and return its parsed data.
+    
+    Single acceptance rule for is_valid_json and extract_clean_json.
+    Placeholder domains are checked on the raw string first, so templated
+    answers are rejected without parsing.
+    
+    Args:
+        json_str: JSON string to validate
+        
+    Returns:
+        Tuple of (valid, parsed data); a flag is used since JSON null parses to None
+    """
+    # Check for placeholder domains in the entire JSON string (case-insensitive)
+    if _PLACEHOLDER_RE.search(json_str):
+        logger.debug("[VALIDATOR] Rejected: contains placeholder domain ('example' or 'domain.com')")
+        return False, None
+    
+    try:
+        return True, json.loads(json_str)
+    except json.JSONDecodeError as e:
+        logger.debug("[VALIDATOR] Invalid JSON syntax: %s", e)
+        return False, None
+
+
+@lru_cache(maxsize=256)
 def is_valid_json(json_str: str) -> bool:
     """Validate JSON string for valid syntax and no placeholder content.
     
@@ -22,52 +96,47 @@ def is_valid_json(json_str: str) -> bool:
     if not json_str:
         return False
     
-    try:
-        # Parse JSON to verify syntax
-        json.loads(json_str)
-        
-        # Check for placeholder domains in the entire JSON string (case-insensitive)
-        json_lower = json_str.lower()
-        if 'example' in json_lower or 'domain.com' in json_lower:
-            print(f"[VALIDATOR] Rejected: contains placeholder domain ('example' or 'domain.com')")
-            return False
-        
-        return True
-        
-    except json.JSONDecodeError as e:
-        print(f"[VALIDATOR] Invalid JSON syntax: {e}")
-        return False
+    valid, _ = _parse_valid_json(json_str)
+    return valid
 
 
-def _verify_json_integrity(json_str: str) -> bool:
-    """Verify that all brackets and braces are properly balanced in JSON string.
+def _scan_json(buf: bytes, start: int) -> Tuple[int, int, bool]:
+    """Find the end of the JSON structure opening at `start` in a single pass.
+    
+    Tracks brace/bracket balance and string state (with escapes), stopping at
+    the character that closes the outermost structure. This also acts as the
+    integrity check: a closing brace/bracket without a matching opener fails.
+    Works on bytes: iterating yields ints, which compare much faster in
+    CPython than one-character str objects.
     
     Args:
-        json_str: JSON string to verify
+        buf: ASCII bytes to scan
+        start: Index of the opening { or [
         
     Returns:
-        True if all brackets are balanced, False otherwise
+        Tuple of (start, end, ok)
+        - end: Index of the closing character, or -1 if never closed
+        - ok: True if the structure is closed and all brackets are balanced
     """
-    if not json_str:
-        return False
-    
     brace_balance = 0  # { }
     bracket_balance = 0  # [ ]
     in_string = False
     escape_next = False
     
-    for char in json_str:
+    for i in range(start, len(buf)):
+        char = buf[i]
+        
         # Handle escape sequences inside strings
         if escape_next:
             escape_next = False
             continue
         
-        if char == '\\' and in_string:
+        if char == 0x5C and in_string:  # backslash
             escape_next = True
             continue
         
         # Toggle string state on quotes (only unescaped)
-        if char == '"':
+        if char == 0x22:  # "
             in_string = not in_string
             continue
         
@@ -76,85 +145,77 @@ def _verify_json_integrity(json_str: str) -> bool:
             continue
         
         # Count braces and brackets
-        if char == '{':
+        if char == 0x7B:  # {
             brace_balance += 1
-        elif char == '}':
+        elif char == 0x7D:  # }
             brace_balance -= 1
-        elif char == '[':
+        elif char == 0x5B:  # [
             bracket_balance += 1
-        elif char == ']':
+        elif char == 0x5D:  # ]
             bracket_balance -= 1
+        else:
+            continue
         
         # Early exit if balance goes negative (closing without opening)
         if brace_balance < 0 or bracket_balance < 0:
-            return False
+            return start, i, False
+        
+        # Check if we've closed the outermost structure
+        if brace_balance == 0 and bracket_balance == 0:
+            return start, i, True
     
-    # All brackets must be closed and not inside a string
-    return brace_balance == 0 and bracket_balance == 0 and not in_string
+    return start, -1, False
+
 
+def _clean_value(val: str) -> str:
+    """Clean a single string value from artifacts."""
+    original = val
+    
+    # Remove common Google AI artifacts
+    val = _USE_CODE_RE.sub('', val)
+    val = val.strip()
+    
+    # For domain-like values, strip leading/trailing "json" artifacts
+    # Only if the result still looks like a valid domain
+    # At most _MAX_JSON_ARTIFACTS are stripped, leading ones first
+    m = _JSON_WRAPPED_DOMAIN_RE.fullmatch(val)
+    if m:
+        prefix_len = len(m.group('prefix'))
+        budget = _MAX_JSON_ARTIFACTS * len('json') - prefix_len
+        suffix_len = min(len(m.group('suffix')), budget)
+        if prefix_len or suffix_len:
+            val = val[prefix_len:len(val) - suffix_len]
+    
+    if val != original:
+        logger.debug("[JSON] Sanitized value: '%s' -> '%s'", original, val)
+    
+    return val
 
-def _sanitize_json_string_values(json_str: str) -> str:
-    """Clean Google AI artifacts from string values inside parsed JSON.
+
+def _sanitize_json_string_values(data) -> None:
+    """Clean Google AI artifacts from string values inside parsed JSON, in place.
     
     Handles cases like {"domain":"jsonabm.comjson"} -> {"domain":"abm.com"}
     where the literal word "json" is concatenated to domain values.
     
     Args:
-        json_str: Valid JSON string
-        
-    Returns:
-        JSON string with cleaned values
+        data: Parsed JSON structure (dict or list), mutated in place
     """
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError:
-        return json_str
-    
-    def clean_value(val: str) -> str:
-        """Clean a single string value from artifacts."""
-        if not isinstance(val, str):
-            return val
-        
-        original = val
-        
-        # Remove common Google AI artifacts
-        val = re.sub(r'use code with caution\.?', '', val, flags=re.IGNORECASE)
-        val = val.strip()
-        
-        # For domain-like values, strip leading/trailing "json" artifacts
-        # Only if the result still looks like a valid domain
-        domain_pattern = re.compile(r'^[a-z0-9][a-z0-9.-]*[a-z0-9]\.[a-z]{2,}$', re.IGNORECASE)
-        
-        # Try stripping "json" from start/end (up to 2 iterations for both sides)
-        for _ in range(2):
-            if val.lower().startswith('json') and domain_pattern.match(val[4:]):
-                val = val[4:]
-                continue
-            if val.lower().endswith('json') and domain_pattern.match(val[:-4]):
-                val = val[:-4]
-                continue
-            break
-        
-        if val != original:
-            print(f"[JSON] Sanitized value: '{original}' -> '{val}'")
-        
-        return val
-    
-    def clean_recursive(obj):
-        """Recursively clean all string values in a JSON structure."""
-        if isinstance(obj, dict):
-            return {k: clean_recursive(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [clean_recursive(item) for item in obj]
-        elif isinstance(obj, str):
-            return clean_value(obj)
-        else:
-            return obj
-    
-    cleaned_data = clean_recursive(data)
-    return json.dumps(cleaned_data)
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+        for key, value in items:
+            if isinstance(value, str):
+                # Only write back values that actually changed (most don't)
+                cleaned = _clean_value(value)
+                if cleaned != value:
+                    obj[key] = cleaned
+            elif value and isinstance(value, (dict, list)):
+                stack.append(value)
 
 
+@lru_cache(maxsize=256)
 def extract_clean_json(text: str) -> str:
     """Extract clean JSON from text that may contain markdown or HTML.
     
@@ -162,6 +223,9 @@ def extract_clean_json(text: str) -> str:
     accounting for nested braces/brackets.
     Validates that extracted JSON is parseable.
     
+    Results are cached by text: the response loop polls the same (or
+    repeated) AI text many times while waiting for it to settle.
+    
     Args:
         text: Raw text from AI response
         
@@ -171,100 +235,45 @@ def extract_clean_json(text: str) -> str:
     if not text:
         return ""
     
-    # Remove Google AI markdown artifacts FIRST (before any other processing)
-    # These appear when AI returns fragmented JSON with markdown formatting:
-    # e.g., {"domain":"Use code with caution.jsonabm.comUse code with caution.json"}
-    cleaned = text
-    cleaned = re.sub(r'Use code with caution\.?', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'```json\s*', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'```\s*', '', cleaned)
-    # Remove standalone "json" word that appears before JSON content (but not inside strings)
-    cleaned = re.sub(r'\bjson\b(?=\s*[{"\[])', '', cleaned, flags=re.IGNORECASE)
-    
-    # Keep only valid JSON characters: letters, digits, JSON syntax, whitespace
-    # This removes markdown, control characters, and other garbage
-    # Allow: a-z A-Z 0-9 {} [] : , " ' . - _ @ space tab
-    cleaned = re.sub(r'[^a-zA-Z0-9{}\[\]:,"\'\.@\-_ \t]', '', cleaned)
+    # Remove Google AI markdown artifacts FIRST (see _CLEAN_RE), then keep only
+    # valid JSON characters: non-ASCII is dropped by the encode, the rest by a
+    # byte-level translate. The scan below stays on bytes
+    cleaned = _CLEAN_RE.sub('', text)
+    buf = cleaned.encode('ascii', 'ignore').translate(None, _DISALLOWED_ASCII)
     
     # Find first { or [
-    json_start = -1
-    start_char = None
-    for i, char in enumerate(cleaned):
-        if char in ('{', '['):
-            json_start = i
-            start_char = char
-            break
-    
-    if json_start == -1:
+    starts = [i for i in (buf.find(b'{'), buf.find(b'[')) if i >= 0]
+    if not starts:
         return ""  # No JSON found
+    json_start = min(starts)
+    start_char = chr(buf[json_start])
     
-    # Find matching closing brace/bracket by counting balance for BOTH types
-    # Also track if we're inside a string to ignore brackets in strings
-    brace_balance = 0  # { }
-    bracket_balance = 0  # [ ]
-    in_string = False
-    escape_next = False
-    json_end = -1
+    # Find matching closing brace/bracket and verify integrity in one pass
+    _, json_end, ok = _scan_json(buf, json_start)
     
-    for i in range(json_start, len(cleaned)):
-        char = cleaned[i]
-        
-        # Handle escape sequences inside strings
-        if escape_next:
-            escape_next = False
-            continue
-        
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-        
-        # Toggle string state on quotes (only unescaped)
-        if char == '"':
-            in_string = not in_string
-            continue
-        
-        # Skip bracket counting if inside a string
-        if in_string:
-            continue
-        
-        # Count braces and brackets
-        if char == '{':
-            brace_balance += 1
-        elif char == '}':
-            brace_balance -= 1
-        elif char == '[':
-            bracket_balance += 1
-        elif char == ']':
-            bracket_balance -= 1
-        
-        # Check if we've closed the outermost structure
-        if start_char == '{' and brace_balance == 0 and bracket_balance == 0:
-            json_end = i
-            break
-        elif start_char == '[' and bracket_balance == 0 and brace_balance == 0:
-            json_end = i
-            break
-    
-    if json_end == -1 or json_end <= json_start:
-        print(f"[JSON] Incomplete JSON: brace_balance={brace_balance}, bracket_balance={bracket_balance}, in_string={in_string}")
+    if json_end == -1:
+        logger.debug("[JSON] Incomplete JSON: no matching close for '%s'", start_char)
         return ""  # No matching closing brace - let fallback handle it
     
     # Extract JSON substring
-    json_str = cleaned[json_start:json_end + 1].strip()
+    json_str = buf[json_start:json_end + 1].decode('ascii')
+    
+    # Integrity check: every closing bracket must have a matching opener
+    if not ok:
+        logger.debug("[JSON] Integrity check failed for: %.100s", json_str)
+        return ""
     
-    # Final integrity check: verify all brackets are balanced
-    if not _verify_json_integrity(json_str):
-        print(f"[JSON] Integrity check failed for: {json_str[:100]}")
+    # Validate and parse once (same rule as is_valid_json).
+    # Sanitizing only strips artifacts, so it can't add or remove a placeholder
+    valid, data = _parse_valid_json(json_str)
+    if not valid:
         return ""
     
     # Clean artifacts from string VALUES inside the JSON (e.g. "jsonabm.comjson" -> "abm.com")
-    json_str = _sanitize_json_string_values(json_str)
+    _sanitize_json_string_values(data)
+    json_str = json.dumps(data)
     
-    # Validate using comprehensive validator
-    if is_valid_json(json_str):
-        return json_str
-    else:
-        return ""  # Not valid JSON or failed validation
+    return json_str
 
 # Textarea selectors
 AI_TEXTAREA_SEL = "textarea.ITIRGe"
@@ -284,6 +293,18 @@ AI_RESPONSE_FALLBACKS = [
 # No search fallbacks - we only work with AI mode selectors
 # Regular search selectors like #search, #rcnt, #main are not reliable for AI responses
 
+# Captcha selectors (profile-level block detection)
+_CAPTCHA_SELECTORS = [
+    "iframe[src*='recaptcha']",
+    "iframe[src*='hcaptcha']",
+    "div.g-recaptcha",
+    "div.h-captcha",
+    "#captcha-form",
+]
+# Selector list joined into one CSS selector group: a single find_elements
+# round-trip returns the union instead of one call per selector
+CAPTCHA_SELECTOR_GROUP = ", ".join(_CAPTCHA_SELECTORS)
+
 # Button selectors
 NEW_SEARCH_BUTTON_SELECTORS = [
     "button[aria-label='Start new search']",
@@ -293,13 +314,60 @@ NEW_SEARCH_BUTTON_SELECTORS = [
 ]
 
 
-def extract_ai_response(session_manager) -> Dict[str, str]:
+# Static script for extract_ai_response; selectors are passed as arguments so the
+# source string never changes and the browser can reuse its compiled code.
+# Each WebDriver call is an HTTP round-trip, so selector lookups and text/HTML
+# reads all happen in the browser.
+# arguments[0]: primary selector, arguments[1]: fallback selectors,
+# arguments[2]: whether to serialize HTML (can be hundreds of KB, skipped when unused)
+_EXTRACT_AI_RESPONSE_JS = """
+return ((primarySelector, aiSelectors, needHtml) => {
+  // Primary selector: AI response container with data-subtree="aimfl"
+  // IMPORTANT: Take the LAST element (most recent response)
+  const aimflElements = document.querySelectorAll(primarySelector);
+  if (aimflElements.length) {
+    const element = aimflElements[aimflElements.length - 1];
+    // Google AI splits JSON across multiple sibling elements!
+    // {"domain":"<!--Sv6Kpe[]-->} is in one div, and the rest is in siblings
+    // Solution: get textContent of PARENT element to capture all siblings
+    const container = element.parentElement || element;
+    const text = (container.textContent || '').trim();
+    if (text) {
+      return { text, html: needHtml ? (container.outerHTML || '') : '', source: 'aimfl' };
+    }
+  }
+  
+  // Try other AI-specific selectors
+  for (const selector of aiSelectors) {
+    const element = document.querySelector(selector);
+    const text = element ? (element.innerText || '').trim() : '';
+    if (text.length > 10) {
+      return { text, html: needHtml ? (element.innerHTML || '') : '', source: selector };
+    }
+  }
+  
+  // Fallback: assistant message bubbles
+  const bubbles = document.querySelectorAll("div[data-message-author-role='assistant']");
+  if (bubbles.length) {
+    const bubble = bubbles[bubbles.length - 1];
+    const html = needHtml ? (bubble.outerHTML || '') : '';
+    return { text: (bubble.innerText || '').trim(), html, source: 'assistant' };
+  }
+  
+  // No AI selectors found - return empty
+  return { text: '', html: '', source: 'none' };
+})(arguments[0], arguments[1], arguments[2]);
+"""
+
+
+def extract_ai_response(session_manager, need_html: bool = False) -> Dict[str, str]:
     """Extract AI response from Google search page.
     
     Mirrors the logic from tools/chromium-worker/search/selectors.js
     
     Args:
         session_manager: Session manager (single source of truth for driver)
+        need_html: Also serialize the response HTML; otherwise 'html' is empty
         
     Returns:
         Dict with 'text' and 'html' keys
@@ -312,99 +380,19 @@ def extract_ai_response(session_manager) -> Dict[str, str]:
     if not driver:
         return {"text": "", "html": ""}
     
-    # Try direct Selenium access first (more reliable than execute_script)
-    from selenium.webdriver.common.by import By
-    try:
-        # Primary selector: aimfl (MUST check this first, it's the most reliable)
-        # IMPORTANT: Take the LAST element (most recent response)
-        aimfl_elements = driver.find_elements(By.CSS_SELECTOR, AI_RESPONSE_SEL_PRIMARY)
-        if aimfl_elements:
-            element = aimfl_elements[-1]
-            
-            # Google AI splits JSON across multiple sibling elements!
-            # {"domain":"<!--Sv6Kpe[]-->} is in one div, and the rest is in siblings
-            # Solution: get textContent of PARENT element to capture all siblings
-            try:
-                parent = driver.execute_script("return arguments[0].parentElement;", element)
-                if parent:
-                    text = driver.execute_script("return arguments[0].textContent;", parent).strip()
-                    html = parent.get_attribute("outerHTML") or ""
-                else:
-                    # Fallback to element itself if no parent
-                    text = driver.execute_script("return arguments[0].textContent;", element).strip()
-                    html = element.get_attribute("outerHTML") or ""
-            except Exception:
-                text = element.text.strip()
-                html = element.get_attribute("outerHTML") or ""
-            # Only log substantial responses to reduce noise (disabled to reduce spam)
-            # if len(aimfl_elements) > 1:
-            #     print(f"[SELECTORS] Found {len(aimfl_elements)} aimfl elements, using last one")
-            # if text and len(text) > 20:
-            #     print(f"[SELECTORS] Found aimfl via Selenium, size={len(text)}")
-            if text:
-                return {"text": text, "html": html}
-    except Exception as e:
-        print(f"[SELECTORS] Selenium aimfl failed: {e}")
-    
-    # Try AI-specific selectors (NOT search fallbacks yet)
-    for sel in AI_RESPONSE_FALLBACKS:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, sel)
-            if elements:
-                text = elements[0].text.strip()
-                if len(text) > 10:
-                    html = elements[0].get_attribute("innerHTML") or ""
-                    print(f"[SELECTORS] Found {sel} via Selenium, size={len(text)}")
-                    return {"text": text, "html": html}
-        except Exception:
-            pass
-    
-    # If no AI selectors found via Selenium, try JS script as last resort
+    # Collect everything in a single execute_script call (see _EXTRACT_AI_RESPONSE_JS)
     try:
-        script = f"""
-        (() => {{
-          // Primary selector: AI response container with data-subtree="aimfl"
-          const aimflElement = document.querySelector({repr(AI_RESPONSE_SEL_PRIMARY)});
-          if (aimflElement) {{
-            const text = (aimflElement.textContent || '').trim();
-            console.log('[SELECTORS] Found aimfl, size=' + text.length);
-            // Return even if empty, let caller decide
-            return {{ text, html: aimflElement.outerHTML || aimflElement.innerHTML || '', source: 'aimfl' }};
-          }}
-          
-          // Try other AI-specific selectors
-          const aiSelectors = {AI_RESPONSE_FALLBACKS};
-          for (const selector of aiSelectors) {{
-            const element = document.querySelector(selector);
-            if (element && element.textContent && element.textContent.trim().length > 10) {{
-              console.log('[SELECTORS] Found ' + selector + ', size=' + element.textContent.trim().length);
-              return {{ text: element.textContent.trim(), html: element.innerHTML || '', source: selector }};
-            }}
-          }}
-          
-          // No AI selectors found - return empty
-          console.log('[SELECTORS] No valid selectors found');
-          return {{ text: '', html: '', source: 'none' }};
-        }})()
-        """
-        res = driver.execute_script(script)
-        if isinstance(res, dict) and "text" in res:
-            source = res.get("source", "unknown")
-            text = str(res.get("text") or "")
-            text_len = len(text)
-            print(f"[SELECTORS] Extracted from {source}, size={text_len}, preview={text[:100]}")
-            return {"text": text, "html": str(res.get("html") or "")}
+        res = driver.execute_script(
+            _EXTRACT_AI_RESPONSE_JS, AI_RESPONSE_SEL_PRIMARY, AI_RESPONSE_FALLBACKS, need_html
+        )
     except Exception as e:
-        print(f"[SELECTORS] Script execution failed: {e}")
+        logger.warning("[SELECTORS] Script execution failed: %s", e)
+        return {"text": "", "html": ""}
     
-    # Fallback: try to find assistant message bubbles
-    try:
-        from selenium.webdriver.common.by import By
-        bubbles = driver.find_elements(By.CSS_SELECTOR, "div[data-message-author-role='assistant']")
-        if bubbles:
-            txt = bubbles[-1].text.strip()
-            return {"text": txt, "html": bubbles[-1].get_attribute("outerHTML") or ""}
-    except Exception:
-        pass
+    if not isinstance(res, dict):
+        return {"text": "", "html": ""}
     
-    return {"text": "", "html": ""}
+    text = str(res.get("text") or "")
+    if text and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[SELECTORS] Extracted from %s, size=%d, preview=%s", res.get("source", "unknown"), len(text), text[:100])
+    return {"text": text, "html": str(res.get("html") or "")}
@@ -128,7 +128,7 @@ def send_followup_prompt(prompt: str, session_manager) -> Dict[str, str]:
     t_end = time.time() + ANSWER_TIMEOUT
     
     # Capture initial HTML before followup to detect when DOM actually changes
-    initial_res = extract_ai_response(session_manager)
+    initial_res = extract_ai_response(session_manager, need_html=True)
     initial_text = (initial_res.get("text") or "").strip()
     initial_html = (initial_res.get("html") or "").strip()
     print(f"[FOLLOWUP] Initial text before followup: {repr(initial_text[:100])}")
@@ -146,7 +146,7 @@ def send_followup_prompt(prompt: str, session_manager) -> Dict[str, str]:
     
     while time.time() < t_end:
         try:
-            res = extract_ai_response(session_manager)
+            res = extract_ai_response(session_manager, need_html=True)
             text = (res.get("text") or "").strip()
             html = (res.get("html") or "").strip()
             
@@ -194,7 +194,7 @@ def send_followup_prompt(prompt: str, session_manager) -> Dict[str, str]:
         time.sleep(0.1)
     
     # Timeout - return what we have
-    final_res = extract_ai_response(session_manager)
+    final_res = extract_ai_response(session_manager, need_html=True)
     final_text = (final_res.get("text") or "").strip()
     print(f"[FOLLOWUP] Timeout - returning final text, size={len(final_text)}")
     return {"text": final_text, "html": final_res.get("html", "")}
@@ -505,7 +505,9 @@ def search_google_ai(prompt: str, session_manager, _retry_count: int = 0, _force
                     if cleaned and is_valid_response(text):
                         # Valid JSON found - return immediately
                         print(f"[SEARCH] Valid JSON found, size={len(cleaned)} - returning immediately")
-                        return {"text": cleaned, "html": res.get('html', ''), "raw_text": text}
+                        # Polling reads text only; fetch HTML once for the result
+                        html = extract_ai_response(session_manager, need_html=True).get('html', '')
+                        return {"text": cleaned, "html": html, "raw_text": text}
                     
                     # No valid JSON yet - check if text is changing
                     if text != last_text:
@@ -6,6 +6,7 @@ Structured similarly to tools/chromium-worker/search for maintainability.
 """
 import os
 import time
+import logging
 import asyncio
 import threading
 import random
@@ -24,6 +25,12 @@ from healthcheck_server import start_health_server
 
 # ---------- CONFIG ----------
 PORT = int(os.environ.get("WORKER_PORT", "4101"))
+LOG_LEVEL = os.environ.get("PY_LOG_LEVEL", "INFO").upper()
+
+# Worker modules that use `logging` (browser.*) log at PY_LOG_LEVEL;
+# third-party loggers keep the root default (WARNING)
+logging.basicConfig(format="[%(levelname)s] %(name)s: %(message)s")
+logging.getLogger("browser").setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
 # ---------- STATE ----------
 session_manager = SessionManager()